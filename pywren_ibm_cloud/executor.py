@@ -4,6 +4,7 @@ import time
 import enum
 import json
 import signal
+import subprocess
 import logging
 import traceback
 from pywren_ibm_cloud.invoker import Invoker
@@ -450,15 +451,19 @@ class FunctionExecutor:
             # clean_os_bucket(storage_bucket, storage_prerix, self.internal_storage)
 
             # 2nd case: Execute in Background as a subprocess. The main program does not wait for its completion.
+            # The script is passed through stdin, so no shell is spawned and the
+            # storage config does not need to be escaped into the command line.
             storage_config = json.dumps(self.internal_storage.get_storage_config())
-            storage_config = storage_config.replace('"', '\\"')
-
-            cmdstr = ("{} -c 'from pywren_ibm_cloud.storage.utils import clean_bucket; \
-                              clean_bucket(\"{}\", \"{}\", \"{}\")'".format(sys.executable,
-                                                                            storage_bucket,
-                                                                            storage_prerix,
-                                                                            storage_config))
-            os.popen(cmdstr)
+            script = ('from pywren_ibm_cloud.storage.utils import clean_bucket\n'
+                      'clean_bucket({!r}, {!r}, {!r})\n'.format(storage_bucket,
+                                                               storage_prerix,
+                                                               storage_config))
+            # The process is not waited on; a reference is kept so that it is not
+            # collected (and reported as a ResourceWarning) while it still runs.
+            self._cleaner = subprocess.Popen([sys.executable, '-'], stdin=subprocess.PIPE,
+                                             stdout=subprocess.DEVNULL)
+            self._cleaner.stdin.write(script.encode())
+            self._cleaner.stdin.close()
 
         else:
             extra_env = {'STORE_STATUS': False,
@@ -3,6 +3,7 @@ import time
 import pickle
 import logging
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 import pywren_ibm_cloud as pywren
 from .serialize import SerializeIndependent, create_module_data
 from .partitioner import create_partitions, partition_processor
@@ -149,6 +150,28 @@ def _agg_data(data_strs):
     return b"".join(data_strs), ranges
 
 
+def _exclude_module_paths(mod_paths, exclude_modules):
+    """
+    Auxiliary function that filters out, in a single pass, the module paths
+    that contain any of the excluded module names
+    """
+    if not exclude_modules:
+        return mod_paths
+    return {mod_path for mod_path in mod_paths
+            if not any(module in mod_path for module in exclude_modules)}
+
+
+def _upload_object(put_method, key, obj):
+    """
+    Auxiliary function that uploads an object and returns its upload time and
+    the timestamp at which the upload finished
+    """
+    upload_time = time.time()
+    put_method(key, obj)
+    upload_timestamp = time.time()
+    return upload_timestamp - upload_time, upload_timestamp
+
+
 def _create_job(config, internal_storage, executor_id, job_id, func, iterdata, extra_env=None, extra_meta=None,
                 runtime_memory=None, invoke_pool_threads=128, overwrite_invoke_args=None,
                 exclude_modules=None, original_func_name=None, remote_invocation=False, original_total_tasks=None,
@@ -215,50 +238,45 @@ def _create_job(config, internal_storage, executor_id, job_id, func, iterdata, e
     func_and_data_ser, mod_paths = serializer([func] + data)
 
     func_str = func_and_data_ser[0]
-    data_strs = func_and_data_ser[1:]
-    data_size_bytes = sum(len(x) for x in data_strs)
+    data_size_bytes = sum(len(x) for x in func_and_data_ser[1:])
 
     host_job_meta['agg_data'] = False
     host_job_meta['data_size_bytes'] = data_size_bytes
 
-    log_msg = 'ExecutorID {} | JobID {} - Uploading function and data'.format(executor_id, job_id)
-    logger.info(log_msg)
-    if not log_level:
-        print(log_msg, end=' ')
-
-    if data_size_bytes < MAX_AGG_DATA_SIZE:
-        agg_data_key = create_agg_data_key(internal_storage.prefix, executor_id, job_id)
-        job_description['data_key'] = agg_data_key
-        agg_data_bytes, agg_data_ranges = _agg_data(data_strs)
-        job_description['data_ranges'] = agg_data_ranges
-        agg_upload_time = time.time()
-        internal_storage.put_data(agg_data_key, agg_data_bytes)
-        host_job_meta['agg_data'] = True
-        host_job_meta['data_upload_time'] = time.time() - agg_upload_time
-        host_job_meta['data_upload_timestamp'] = time.time()
-    else:
+    if data_size_bytes >= MAX_AGG_DATA_SIZE:
         log_msg = ('ExecutorID {} | JobID {} - Total data exceeded '
                    'maximum size of {} bytes'.format(executor_id, job_id, MAX_AGG_DATA_SIZE))
         raise Exception(log_msg)
 
-    if exclude_modules:
-        for module in exclude_modules:
-            for mod_path in list(mod_paths):
-                if module in mod_path and mod_path in mod_paths:
-                    mod_paths.remove(mod_path)
+    agg_data_bytes, agg_data_ranges = _agg_data(func_and_data_ser[1:])
+    # Release the per-item strings, only the aggregated copy is needed from now on
+    del func_and_data_ser
 
+    agg_data_key = create_agg_data_key(internal_storage.prefix, executor_id, job_id)
+    job_description['data_key'] = agg_data_key
+    job_description['data_ranges'] = agg_data_ranges
+
+    mod_paths = _exclude_module_paths(mod_paths, exclude_modules)
     module_data = create_module_data(mod_paths)
-    # Create func and upload
+    # Create func
     host_job_meta['func_name'] = func_name
     func_module_str = pickle.dumps({'func': func_str, 'module_data': module_data}, -1)
     host_job_meta['func_module_bytes'] = len(func_module_str)
-
-    func_upload_time = time.time()
     func_key = create_func_key(internal_storage.prefix, executor_id, job_id)
     job_description['func_key'] = func_key
-    internal_storage.put_func(func_key, func_module_str)
-    host_job_meta['func_upload_time'] = time.time() - func_upload_time
-    host_job_meta['func_upload_timestamp'] = time.time()
+
+    log_msg = 'ExecutorID {} | JobID {} - Uploading function and data'.format(executor_id, job_id)
+    logger.info(log_msg)
+    if not log_level:
+        print(log_msg, end=' ')
+
+    # Upload data and func concurrently, both uploads are network-bound
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        data_upload = executor.submit(_upload_object, internal_storage.put_data, agg_data_key, agg_data_bytes)
+        func_upload = executor.submit(_upload_object, internal_storage.put_func, func_key, func_module_str)
+        host_job_meta['data_upload_time'], host_job_meta['data_upload_timestamp'] = data_upload.result()
+        host_job_meta['agg_data'] = True
+        host_job_meta['func_upload_time'], host_job_meta['func_upload_timestamp'] = func_upload.result()
 
     if not log_level:
         func_and_data_size = utils.sizeof_fmt(host_job_meta['func_module_bytes']+host_job_meta['data_size_bytes'])
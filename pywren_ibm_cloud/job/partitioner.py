@@ -23,7 +23,6 @@ import requests
 import inspect
 from pywren_ibm_cloud import utils
 from multiprocessing.pool import ThreadPool
-from pywren_ibm_cloud.storage.backends.ibm_cos.ibm_cos import StorageBackend as ibm_cos_backend
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +53,7 @@ def partition_processor(map_function):
                 bucket = map_func_args['bucket']
                 key = map_func_args['key']
 
+            from pywren_ibm_cloud.storage.backends.ibm_cos.ibm_cos import StorageBackend as ibm_cos_backend
             config = json.loads(os.environ.get('CB_CONFIG'))
             storage = ibm_cos_backend(config['ibm_cos'])
             logger.info('Getting dataset from cos://{}/{}'.format(bucket, key))
@@ -82,6 +82,7 @@ def create_partitions(config, arg_data, chunk_size):
     logger.debug('Starting partitioner')
 
     # We suppose here that the data is always in IBM COS.  TODO: Make it Generic.
+    from pywren_ibm_cloud.storage.backends.ibm_cos.ibm_cos import StorageBackend as ibm_cos_backend
     storage = ibm_cos_backend(config['ibm_cos'])
 
     map_func_keys = arg_data[0].keys()
@@ -17,6 +17,7 @@
 import os
 import logging
 from pathlib import Path
+from collections import OrderedDict
 from io import BytesIO as StringIO
 from pywren_ibm_cloud.utils import bytes_to_b64str
 from pywren_ibm_cloud.libs.cloudpipe.cloudpickle import CloudPickler
@@ -30,12 +31,17 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# LRU of encoded module files, keyed by path and validated by mtime and size.
+# It is bounded by the total size of the encoded content it holds
+MODULE_FILES_CACHE_SIZE = 32 * 1024 * 1024  # 32MB
+_module_files_cache = OrderedDict()
+_module_files_cache_bytes = 0
+
 
 class SerializeIndependent:
 
     def __init__(self, preinstalls):
-        self.preinstalled_modules = preinstalls
-        self.preinstalled_modules.append(['pywren_ibm_cloud', True])
+        self.preinstalled_modules = preinstalls + [['pywren_ibm_cloud', True]]
         self._modulemgr = None
 
     def __call__(self, list_of_objs, **kwargs):
@@ -65,10 +71,11 @@ class SerializeIndependent:
             ignore_modulemgr = False
 
         if not ignore_modulemgr:
-            # Add modules
-            for cp in cps:
-                for module in cp.modules:
-                    self._modulemgr.add(module.__name__)
+            # Add modules. Most data items reference the same modules, so
+            # each module is queued only once for dependency analysis
+            module_names = {module.__name__ for cp in cps for module in cp.modules}
+            for module_name in module_names:
+                self._modulemgr.add(module_name)
 
         mod_paths = self._modulemgr.get_and_clear_paths()
         logger.debug("Modules to transmit: {}".format(None if not mod_paths else mod_paths))
@@ -89,9 +96,40 @@ def create_module_data(mod_paths):
             files = [m]
         for f in files:
             f = os.path.abspath(f)
-            with open(f, 'rb') as file:
-                mod_str = file.read()
             dest_filename = Path(f[len(pkg_root)+1:]).as_posix()
-            module_data[dest_filename] = bytes_to_b64str(mod_str)
+            module_data[dest_filename] = _encode_module_file(f)
 
     return module_data
+
+
+def _encode_module_file(filename):
+    """
+    Returns the b64 content of a module file. The content is cached so that
+    repeated jobs over the same modules do not read and encode them again.
+    """
+    global _module_files_cache_bytes
+
+    st = os.stat(filename)
+    file_stamp = (st.st_mtime_ns, st.st_size)
+    cached = _module_files_cache.pop(filename, None)
+    if cached:
+        _module_files_cache_bytes -= len(cached[1])
+        if cached[0] == file_stamp:
+            encoded_mod = cached[1]
+            _module_files_cache[filename] = cached
+            _module_files_cache_bytes += len(encoded_mod)
+            return encoded_mod
+
+    with open(filename, 'rb') as file:
+        mod_str = file.read()
+    encoded_mod = bytes_to_b64str(mod_str)
+
+    if len(encoded_mod) <= MODULE_FILES_CACHE_SIZE:
+        _module_files_cache[filename] = (file_stamp, encoded_mod)
+        _module_files_cache_bytes += len(encoded_mod)
+        # Evict the least recently used files until the cache fits again
+        while _module_files_cache_bytes > MODULE_FILES_CACHE_SIZE:
+            _, (_, evicted_mod) = _module_files_cache.popitem(last=False)
+            _module_files_cache_bytes -= len(evicted_mod)
+
+    return encoded_mod
@@ -11,6 +11,14 @@ LOCAL_HOME_DIR = os.path.join(os.path.expanduser('~'), '.cloudbutton')
 logger = logging.getLogger(__name__)
 
 
+def _file_stamp(filename):
+    """
+    Returns the modification time and size of a file, used to detect changes
+    """
+    st = os.stat(filename)
+    return st.st_mtime_ns, st.st_size
+
+
 class Singleton(type):
     _instances = {}
     def __call__(cls, *args, **kwargs):
@@ -32,6 +40,7 @@ class InternalStorage(metaclass=Singleton):
         self.bucket = self.config['bucket']
         self.prefix = self.config['prefix']
         self.tmp_obj_count = 0
+        self.runtime_meta_cache = {}
 
         try:
             module_location = 'pywren_ibm_cloud.storage.backends.{}'.format(self.backend)
@@ -164,11 +173,21 @@ class InternalStorage(metaclass=Singleton):
         filename_local_path = os.path.join(LOCAL_HOME_DIR, *path)
 
         if os.path.exists(filename_local_path):
+            # The local file can be rewritten or removed by another process,
+            # so the in-memory copy is only used while the file is unchanged
+            file_stamp = _file_stamp(filename_local_path)
+            cached = self.runtime_meta_cache.get(key)
+            if cached and cached[0] == file_stamp:
+                logger.debug("Runtime metadata found in memory cache")
+                return cached[1]
+
             logger.debug("Runtime metadata found in local cache")
             with open(filename_local_path, "r") as f:
                 runtime_meta = json.loads(f.read())
+            self.runtime_meta_cache[key] = (file_stamp, runtime_meta)
             return runtime_meta
         else:
+            self.runtime_meta_cache.pop(key, None)
             logger.debug("Runtime metadata not found in local cache. Retrieving it from storage")
             try:
                 obj_key = '/'.join(path).replace('\\', '/')
@@ -181,6 +200,7 @@ class InternalStorage(metaclass=Singleton):
                 with open(filename_local_path, "w") as f:
                     f.write(json.dumps(runtime_meta))
 
+                self.runtime_meta_cache[key] = (_file_stamp(filename_local_path), runtime_meta)
                 return runtime_meta
             except StorageNoSuchKeyError:
                 raise Exception('The runtime {} is not installed.'.format(obj_key))
@@ -205,6 +225,8 @@ class InternalStorage(metaclass=Singleton):
         with open(filename_local_path, "w") as f:
             f.write(json.dumps(runtime_meta))
 
+        self.runtime_meta_cache[key] = (_file_stamp(filename_local_path), runtime_meta)
+
     def delete_runtime_meta(self, key):
         """
         Puit the metadata given a runtime config.
@@ -214,6 +236,7 @@ class InternalStorage(metaclass=Singleton):
         path = ['runtimes', __version__,  key+".meta.json"]
         obj_key = '/'.join(path).replace('\\', '/')
         filename_local_path = os.path.join(LOCAL_HOME_DIR, *path)
+        self.runtime_meta_cache.pop(key, None)
         if os.path.exists(filename_local_path):
             os.remove(filename_local_path)
         self.storage_handler.delete_object(self.bucket, obj_key)